@@ -15,25 +15,125 @@ FUSEKI_URL      # e.g. http://localhost:3030
 DEFAULT_DATASET # e.g. ontoFD
 JENA_USERNAME   # optional
 JENA_PASSWORD   # optional
+JENA_QUERY_CACHE # optional, "0" disables result caching/pinning (set by --workers > 1)
 ```
 """
 
 import os
+import re
+import time
+import atexit
+import asyncio
 import argparse
-from typing import Any, Dict, List
+import functools
+import contextlib
+from itertools import islice
+from threading import RLock
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Iterator, List, Tuple
 
+import blake3
 import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
 from httpx import RequestError, HTTPStatusError
 from pydantic import Field
 from mcp.server.fastmcp import FastMCP
 
+try:
+    # google-re2: linear-time automaton matching for the per-query regexes
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 
 class SparqlError(RuntimeError):
     """Raised when a SPARQL HTTP operation fails."""
 
 
+@contextlib.contextmanager
+def _sparql_errors(operation: str) -> Iterator[None]:
+    """Translate httpx failures of a SPARQL ``operation`` into :class:`SparqlError`."""
+    try:
+        yield
+    except RequestError as err:
+        raise SparqlError(f"Connection error during SPARQL {operation}: {err}") from err
+    except HTTPStatusError as err:
+        text = err.response.text.strip() if err.response else "<no body>"
+        raise SparqlError(f"SPARQL {operation} failed ({err.response.status_code}): {text}") from err
+
+
+# Shared async client used by the MCP tools, so concurrent tool calls are
+# multiplexed on the event loop instead of each blocking a worker thread.
+# It is the only connection pool: keep-alive connections to Fuseki are reused
+# across tool calls and endpoints, instead of paying a new TCP/TLS handshake per
+# SPARQL request. HTTP/2 is negotiated via ALPN on TLS endpoints (concurrent
+# requests share one connection); plain http:// and servers without ALPN
+# transparently stay on HTTP/1.1.
+_ASYNC_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+    timeout=30.0,
+    http2=True,
+)
+
+
+@atexit.register
+def _close_http_client() -> None:
+    try:
+        asyncio.run(_ASYNC_CLIENT.aclose())
+    except RuntimeError:
+        # Pooled connections may belong to an event loop that is already closed.
+        pass
+
+
+_LIST_GRAPHS_QUERY = "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } } ORDER BY ?g"
+
+
+class _LimitedResultBuilder:
+    """Rebuilds a SPARQL JSON result from ijson parse events, keeping at most
+    ``max_rows`` bindings."""
+
+    _BINDING = "results.bindings.item"
+
+    def __init__(self, max_rows: int) -> None:
+        self.max_rows = max_rows
+        self.head: Dict[str, Any] = {}
+        self.boolean: bool | None = None
+        self.bindings: List[Dict[str, Any]] = []
+        self.truncated = False
+        self._object: ijson.ObjectBuilder | None = None
+        self._prefix = ""
+
+    def feed(self, prefix: str, event: str, value: Any) -> None:
+        if self.truncated:
+            return
+        if self._object is not None:
+            self._object.event(event, value)
+            if prefix == self._prefix and event == "end_map":
+                if prefix == "head":
+                    self.head = self._object.value
+                else:
+                    self.bindings.append(self._object.value)
+                self._object = None
+        elif event == "start_map" and prefix in ("head", self._BINDING):
+            if prefix == self._BINDING and len(self.bindings) >= self.max_rows:
+                self.truncated = True
+                return
+            self._object = ijson.ObjectBuilder()
+            self._object.event(event, value)
+            self._prefix = prefix
+        elif prefix == "boolean" and event == "boolean":
+            self.boolean = value
+
+    def result(self) -> Dict[str, Any]:
+        if self.boolean is not None:
+            return {"head": self.head, "boolean": self.boolean}
+        return {"head": self.head, "results": {"bindings": self.bindings}}
+
+
 class JenaClient:
-    """Tiny helper around Apache Jena Fuseki HTTP API."""
+    """Tiny async helper around Apache Jena Fuseki HTTP API."""
 
     def __init__(
         self,
@@ -45,112 +145,329 @@ class JenaClient:
     ) -> None:
         self.base_url = (base_url or os.getenv("FUSEKI_URL", "http://localhost:3030")).rstrip('/')
         self.dataset = (dataset or os.getenv("DEFAULT_DATASET", "ontoFD")).lstrip('/')
-        self.auth = (
-            username or os.getenv("JENA_USERNAME"),
-            password or os.getenv("JENA_PASSWORD"),
-        )
-        if not any(self.auth):
-            self.auth = None  # type: ignore
+        username = username or os.getenv("JENA_USERNAME")
+        password = password or os.getenv("JENA_PASSWORD")
+        # httpx.BasicAuth encodes its header once; reusing the instance avoids
+        # rebuilding it from a (username, password) tuple on every request.
+        self.auth = httpx.BasicAuth(username or "", password or "") if (username or password) else None
         self.timeout = timeout
+        # Per-instance request constants, built once instead of on every call.
+        self._query_url = f"{self.base_url}/{self.dataset}/query"
+        self._update_url = f"{self.base_url}/{self.dataset}/update"
+        self._json_headers = {"Accept": "application/sparql-results+json"}
+        self._tsv_headers = {"Accept": "text/tab-separated-values"}
 
-    def execute_query(self, query: str) -> Dict[str, Any]:
+    async def aexecute_query(self, query: str) -> Dict[str, Any]:
         """Executes a SPARQL SELECT/ASK query and returns JSON result."""
-        url = f"{self.base_url}/{self.dataset}/query"
-        try:
-            resp = httpx.get(
-                url,
+        with _sparql_errors("query"):
+            resp = await _ASYNC_CLIENT.get(
+                self._query_url,
                 params={"query": query},
-                headers={"Accept": "application/sparql-results+json"},
+                headers=self._json_headers,
                 auth=self.auth,
                 timeout=self.timeout,
             )
             resp.raise_for_status()
-            return resp.json()
-        except RequestError as err:
-            raise SparqlError(f"Connection error during SPARQL query: {err}") from err
-        except HTTPStatusError as err:
-            text = err.response.text.strip() if err.response else "<no body>"
-            raise SparqlError(f"SPARQL query failed ({err.response.status_code}): {text}") from err
-
-    def execute_update(self, update: str) -> str:
+        return orjson.loads(resp.content)
+
+    async def aexecute_query_limited(self, query: str, max_rows: int) -> Tuple[Dict[str, Any], bool]:
+        """Executes a SPARQL SELECT/ASK query keeping at most ``max_rows`` bindings.
+
+        The response body is parsed incrementally and the download stops as
+        soon as the limit is exceeded, so memory is bounded by ``max_rows``
+        instead of the whole result set. Returns the JSON result (same shape as
+        :meth:`aexecute_query`) and whether bindings were truncated.
+        """
+        builder = _LimitedResultBuilder(max_rows)
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events)
+        with _sparql_errors("query"):
+            async with _ASYNC_CLIENT.stream(
+                "GET",
+                self._query_url,
+                params={"query": query},
+                headers=self._json_headers,
+                auth=self.auth,
+                timeout=self.timeout,
+            ) as resp:
+                if resp.is_error:
+                    await resp.aread()
+                resp.raise_for_status()
+                async for chunk in resp.aiter_bytes():
+                    parser.send(chunk)
+                    for event in events:
+                        builder.feed(*event)
+                    del events[:]
+                    if builder.truncated:
+                        return builder.result(), True
+                parser.close()
+                for event in events:
+                    builder.feed(*event)
+        return builder.result(), builder.truncated
+
+    async def aexecute_update(self, update: str) -> str:
         """Executes a SPARQL UPDATE and returns a confirmation message."""
-        url = f"{self.base_url}/{self.dataset}/update"
-        try:
-            resp = httpx.post(
-                url,
+        with _sparql_errors("update"):
+            resp = await _ASYNC_CLIENT.post(
+                self._update_url,
                 data={"update": update},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
                 auth=self.auth,
                 timeout=self.timeout,
             )
             resp.raise_for_status()
-            return "Update successful"
-        except RequestError as err:
-            raise SparqlError(f"Connection error during SPARQL update: {err}") from err
-        except HTTPStatusError as err:
-            text = err.response.text.strip() if err.response else "<no body>"
-            raise SparqlError(f"SPARQL update failed ({err.response.status_code}): {text}") from err
-
-    def list_graphs(self) -> List[str]:
+        return "Update successful"
+
+    async def _aexecute_query_tsv(self, query: str) -> List[List[str]]:
+        """Executes a SELECT query as TSV and returns its rows (header skipped).
+
+        Cheaper than JSON for plain projections: no per-binding objects to
+        build and decode, only a line split.
+        """
+        with _sparql_errors("query"):
+            resp = await _ASYNC_CLIENT.get(
+                self._query_url,
+                params={"query": query},
+                headers=self._tsv_headers,
+                auth=self.auth,
+                timeout=self.timeout,
+            )
+            resp.raise_for_status()
+        # Split on "\n" only: str.splitlines() also breaks on U+2028/U+2029 and
+        # other Unicode line separators, which may legally appear inside IRIs.
+        lines = resp.text.removesuffix("\n").split("\n")
+        return [line.removesuffix("\r").split("\t") for line in islice(lines, 1, None)]
+
+    async def alist_graphs(self) -> List[str]:
         """Lists distinct graph URIs in the dataset."""
-        result = self.execute_query(
-            "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } } ORDER BY ?g"
-        )
-        return [b["g"]["value"] for b in result["results"]["bindings"]]
+        return [row[0].strip("<>") for row in await self._aexecute_query_tsv(_LIST_GRAPHS_QUERY)]
+
+
+@functools.lru_cache(maxsize=64)
+def _get_client(endpoint: str | None, dataset: str | None) -> JenaClient:
+    """Return the shared :class:`JenaClient` for an (endpoint, dataset) override pair."""
+    return JenaClient(endpoint, dataset)
+
+
+# Cache of read-only query results, keyed by (base_url, dataset, generation,
+# BLAKE3 digest of the canonical query). Every successful update bumps the
+# generation of its (base_url, dataset), so stale entries are never looked up
+# again and simply age out of the cache.
+# The cache and its invalidation are per process: with several uvicorn workers
+# an update would only invalidate the worker that handled it, so the launcher
+# turns caching off (JENA_QUERY_CACHE=0) when running more than one worker.
+_CACHE_ENABLED = os.getenv("JENA_QUERY_CACHE", "1") != "0"
+_QUERY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_CACHE_LOCK = RLock()
+# Datasets are only added here by _invalidate_dataset, so caller-supplied
+# endpoint/dataset overrides that are merely read from don't grow it.
+_GENERATION: Dict[Tuple[str, str], int] = {}
+# Pinned "building block" results (currently list_graphs of the default
+# FUSEKI_URL/DEFAULT_DATASET only), keyed by (base_url, dataset) ->
+# (generation, monotonic fetch time, value). They are not subject to LRU
+# eviction; they are refreshed after _PINNED_TTL seconds or once an update has
+# moved the dataset to a newer generation. Endpoint/dataset overrides go through
+# the bounded _QUERY_CACHE instead, so _PINNED never holds more than one entry.
+_PINNED: Dict[Tuple[str, str], Tuple[int, float, Any]] = {}
+_PINNED_TTL = 300.0
+_MUTATION_RE = _regex.compile(r"(?i)\b(INSERT|DELETE|CLEAR|DROP|LOAD|CREATE)\b")
+
+# SPARQL lexer used to canonicalize queries before hashing. Literals, IRIs,
+# variables and prefixed names are matched as whole tokens so they are never
+# rewritten; only comments, whitespace and bare keywords are normalized.
+_NON_ASCII = "\x80-\U0010ffff"  # spelled out, since re2's \w is ASCII-only
+_TOKEN_RE = _regex.compile(
+    r'"""(?:"{0,2}(?:[^"\\]|\\.))*"""'
+    r"|'''(?:'{0,2}(?:[^'\\]|\\.))*'''"
+    r'|"(?:[^"\\\n\r]|\\.)*"'
+    r"|'(?:[^'\\\n\r]|\\.)*'"
+    r'|<[^<>"{}|^`\\\x00-\x20]*>'
+    r"|(?:[ \t\r\n]|#[^\r\n]*)+"  # a comment ends at CR or LF
+    rf"|[?$@]?[\w.\-{_NON_ASCII}]*:[\w.\-:%{_NON_ASCII}]*"
+    rf"|[?$@][\w.\-{_NON_ASCII}]+"
+    rf"|[A-Za-z_{_NON_ASCII}][\w\-{_NON_ASCII}]*"
+)
+_KEYWORDS = frozenset({
+    "select", "distinct", "reduced", "as", "construct", "describe", "ask",
+    "from", "named", "where", "order", "by", "asc", "desc", "limit", "offset",
+    "group", "having", "values", "undef", "prefix", "base", "graph", "optional",
+    "union", "minus", "filter", "bind", "service", "silent", "not", "exists", "in",
+})
+
+
+def _canonical_token(match: Any) -> str:
+    token = match.group(0)
+    if token[0] == "#" or token[0].isspace():
+        return " "
+    lowered = token.lower()
+    return lowered if lowered in _KEYWORDS else token
+
+
+def _canonicalize(query: str) -> str:
+    """Normalize comments, whitespace and keyword case of a SPARQL query.
+
+    Variables are deliberately not renamed: they are part of the result
+    (``head.vars`` and binding keys), so queries differing only in variable
+    names must not share a cache entry.
+
+    Comments end at either CR or LF, as in the SPARQL grammar:
+
+    >>> _canonicalize("SELECT * WHERE { ?s ?p ?o } #note\\rLIMIT 1")
+    'select * where { ?s ?p ?o } limit 1'
+    >>> _canonicalize("SELECT * WHERE { ?s ?p ?o } #note\\rLIMIT 1000")
+    'select * where { ?s ?p ?o } limit 1000'
+    """
+    return _TOKEN_RE.sub(_canonical_token, query).strip()
+
+
+def _query_cache_key(client: JenaClient, query: str) -> Tuple[Any, ...]:
+    """Build the result-cache key for ``query`` against ``client``'s dataset.
+
+    >>> client = _get_client(None, None)
+    >>> q = "SELECT * WHERE { ?s ?p ?o } #note\\r"
+    >>> _query_cache_key(client, q + "LIMIT 1") == _query_cache_key(client, q + "LIMIT 1000")
+    False
+    """
+    dataset_key = (client.base_url, client.dataset)
+    digest = blake3.blake3(_canonicalize(query).encode()).digest(length=16)
+    return (*dataset_key, _GENERATION.get(dataset_key, 0), digest)
+
+
+def _invalidate_dataset(client: JenaClient) -> None:
+    """Make cached and pinned results for ``client``'s dataset unreachable.
+
+    O(1): only the dataset's generation changes; nothing is scanned or flushed,
+    and other datasets keep their entries.
+    """
+    with _CACHE_LOCK:
+        dataset_key = (client.base_url, client.dataset)
+        _GENERATION[dataset_key] = _GENERATION.get(dataset_key, 0) + 1
+
+
+async def _cached_query(client: JenaClient, query: str) -> Dict[str, Any]:
+    """Run a read-only query through the result cache."""
+    if not _CACHE_ENABLED or _MUTATION_RE.search(query):
+        return await client.aexecute_query(query)
+
+    with _CACHE_LOCK:
+        key = _query_cache_key(client, query)
+        data = _QUERY_CACHE.get(key)
+    if data is None:
+        data = await client.aexecute_query(query)
+        with _CACHE_LOCK:
+            _QUERY_CACHE[key] = data
+    return data
+
+
+_CATALOGUE: Dict[str, List[str]] = {
+    "select": [
+        "SELECT ?s WHERE { ?s ?p ?o } LIMIT 10",
+        "SELECT ?subject ?predicate ?object WHERE { ?subject ?predicate ?object }"
+    ],
+    "update": [
+        "INSERT DATA { GRAPH <http://example.org> { <http://example.org/subject> <http://example.org/predicate> \"object\" } }",
+        "DELETE WHERE { GRAPH <http://example.org> { ?s ?p ?o } }"
+    ],
+}
+# 'all' category combines every template
+_CATALOGUE["all"] = [t for templates in _CATALOGUE.values() for t in templates]
+# Read-only view built once at import, so lookups allocate nothing
+_CATALOGUE_VIEW = MappingProxyType({cat: tuple(templates) for cat, templates in _CATALOGUE.items()})
 
 
 def _templates_for_category(cat: str) -> Dict[str, Any]:
     """Return SPARQL query templates grouped by category."""
-    catalogue: Dict[str, List[str]] = {
-        "select": [
-            "SELECT ?s WHERE { ?s ?p ?o } LIMIT 10",
-            "SELECT ?subject ?predicate ?object WHERE { ?subject ?predicate ?object }"
-        ],
-        "update": [
-            "INSERT DATA { GRAPH <http://example.org> { <http://example.org/subject> <http://example.org/predicate> \"object\" } }",
-            "DELETE WHERE { GRAPH <http://example.org> { ?s ?p ?o } }"
-        ],
-    }
-    # 'all' category combines every template
-    all_templates = []
-    for templates in catalogue.values():
-        all_templates.extend(templates)
-    catalogue["all"] = all_templates
-    # Return templates for requested category
-    return {"category": cat, "templates": catalogue.get(cat, [])}
+    return {"category": cat, "templates": _CATALOGUE_VIEW.get(cat, ())}
+
 
+mcp = FastMCP("MCP Jena Connector", dependencies=["blake3", "cachetools", "h2", "httpx", "ijson", "orjson"])
 
-mcp = FastMCP("MCP Jena Connector", dependencies=["httpx"])
+@mcp.tool()
+async def execute_sparql_query(
+    query: Annotated[str, Field(description="SPARQL query to execute")],
+    dataset: Annotated[str | None, Field(description="Dataset name (override)")] = None,
+    endpoint: Annotated[str | None, Field(description="Fuseki base URL (override)")] = None,
+    max_rows: Annotated[int | None, Field(ge=1, description="Stream the result and return at most this many bindings")] = None,
+) -> Dict[str, Any]:
+    client = _get_client(endpoint, dataset)
+    if max_rows is not None:
+        data, truncated = await client.aexecute_query_limited(query, max_rows)
+        return {"status": "success", "data": data, "truncated": truncated}
+
+    return {"status": "success", "data": await _cached_query(client, query)}
 
 @mcp.tool()
-def execute_sparql_query(
-    query: str = Field(..., description="SPARQL query to execute"),
-    dataset: str | None = Field(None, description="Dataset name (override)"),
-    endpoint: str | None = Field(None, description="Fuseki base URL (override)"),
+async def execute_sparql_queries(
+    queries: Annotated[List[str], Field(description="Independent SPARQL queries to execute concurrently")],
+    dataset: Annotated[str | None, Field(description="Dataset name (override)")] = None,
+    endpoint: Annotated[str | None, Field(description="Fuseki base URL (override)")] = None,
 ) -> Dict[str, Any]:
-    client = JenaClient(endpoint, dataset)
-    return {"status": "success", "data": client.execute_query(query)}
+    client = _get_client(endpoint, dataset)
+    results = await asyncio.gather(
+        *(_cached_query(client, query) for query in queries), return_exceptions=True
+    )
+    return {
+        "status": "success",
+        "data": [
+            {"status": "error", "message": str(result)}
+            if isinstance(result, Exception)
+            else {"status": "success", "data": result}
+            for result in results
+        ],
+    }
 
 @mcp.tool()
-def execute_sparql_update(
-    update: str = Field(..., description="SPARQL update to execute"),
-    dataset: str | None = Field(None),
-    endpoint: str | None = Field(None),
+async def execute_sparql_update(
+    update: Annotated[str, Field(description="SPARQL update to execute")],
+    dataset: str | None = None,
+    endpoint: str | None = None,
 ) -> Dict[str, str]:
-    client = JenaClient(endpoint, dataset)
-    return {"status": "success", "message": client.execute_update(update)}
+    client = _get_client(endpoint, dataset)
+    try:
+        message = await client.aexecute_update(update)
+    finally:
+        # Fuseki may have committed the update even if the response was lost
+        # (timeout, dropped connection), so invalidate on failure too.
+        _invalidate_dataset(client)
+    return {"status": "success", "message": message}
 
 @mcp.tool()
-def list_graphs(
-    dataset: str | None = Field(None),
-    endpoint: str | None = Field(None),
+async def list_graphs(
+    dataset: str | None = None,
+    endpoint: str | None = None,
 ) -> Dict[str, Any]:
-    client = JenaClient(endpoint, dataset)
-    return {"status": "success", "graphs": client.list_graphs()}
+    client = _get_client(endpoint, dataset)
+    if not _CACHE_ENABLED:
+        return {"status": "success", "graphs": await client.alist_graphs()}
+
+    dataset_key = (client.base_url, client.dataset)
+    generation = _GENERATION.get(dataset_key, 0)
+    default = _get_client(None, None)
+    if dataset_key != (default.base_url, default.dataset):
+        # Overrides use the bounded result cache; the "list_graphs" tag keeps
+        # the key apart from query digests.
+        key = (*dataset_key, generation, "list_graphs")
+        with _CACHE_LOCK:
+            graphs = _QUERY_CACHE.get(key)
+        if graphs is None:
+            graphs = await client.alist_graphs()
+            with _CACHE_LOCK:
+                _QUERY_CACHE[key] = graphs
+        return {"status": "success", "graphs": graphs}
+
+    pinned = _PINNED.get(dataset_key)
+    if pinned is not None and pinned[0] == generation and time.monotonic() - pinned[1] < _PINNED_TTL:
+        return {"status": "success", "graphs": pinned[2]}
+
+    graphs = await client.alist_graphs()
+    with _CACHE_LOCK:
+        # Stored under the generation read before the fetch: if an update
+        # landed meanwhile, this entry is already stale and won't be served.
+        _PINNED[dataset_key] = (generation, time.monotonic(), graphs)
+    return {"status": "success", "graphs": graphs}
 
 @mcp.tool()
 def sparql_query_templates(
-    category: str = Field("all", description="Template category")
+    category: Annotated[str, Field(description="Template category")] = "all",
 ) -> Dict[str, Any]:
     return {"status": "success", "templates": _templates_for_category(category)}
 
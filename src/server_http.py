@@ -7,8 +7,12 @@ from __future__ import annotations
 ---------------------------------
 * Import the `mcp` object from `server` (same tool namespace).
 * Creates the ASGI app with `mcp.streamable_http_app()`.
-* Runs **uvicorn** with customisable host/port (default 127.0.0.1:9000).
+* Runs **uvicorn** with customisable host/port (default 127.0.0.1:9000),
+  on uvloop + httptools when available (falls back to asyncio/h11, e.g. on Windows).
 * Supports `--stateless` to enable stateless mode.
+* Supports `--workers N` to run N uvicorn worker processes (implies `--stateless`,
+  since session state is not shared between workers, and disables the in-process
+  query result cache / list_graphs pinning, whose invalidation is per worker).
 
 Examples:
 ```bash
@@ -16,26 +20,63 @@ python server_http.py                 # 127.0.0.1:9000
 python server_http.py --port 7000     # porta diversa
 python server_http.py --host 0.0.0.0  # bind su tutte le interfacce
 python server_http.py --stateless --port 7000
+python server_http.py --workers 4     # 4 processi worker (stateless)
 ```
 """
 
+import os
 import argparse
 import uvicorn
 from server import mcp  # importa il FastMCP definito in server.py
 
+try:
+    import uvloop  # noqa: F401
+    _LOOP = "uvloop"
+except ImportError:  # uvloop is not available on Windows
+    _LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    _HTTP = "httptools"
+except ImportError:
+    _HTTP = "h11"
+
+
+def build_app():
+    """App factory used by uvicorn, so each worker process builds its own app."""
+    return mcp.streamable_http_app()
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run MCP Jena Connector (streamable-http)")
     parser.add_argument("--host", default="127.0.0.1", help="Bind address, default 127.0.0.1")
     parser.add_argument("--port", type=int, default=9000, help="TCP port, default 9000")
     parser.add_argument("--stateless", action="store_true", help="Run in stateless mode (no sessions)")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes, default 1 (>1 implies --stateless and disables result caching)")
     args = parser.parse_args()
 
-    if args.stateless:
+    if args.stateless or args.workers > 1:
         mcp.settings.stateless_http = True
+        # Worker processes re-import `server`; FastMCP reads its settings from FASTMCP_* env vars.
+        os.environ["FASTMCP_STATELESS_HTTP"] = "true"
+
+    if args.workers > 1:
+        # Cached results live in each worker's memory and an update only
+        # invalidates the worker that handled it; turn caching off so clients
+        # always read their own writes.
+        os.environ["JENA_QUERY_CACHE"] = "0"
 
-    app = mcp.streamable_http_app()
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    uvicorn.run(
+        "server_http:build_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="warning",
+        access_log=False,
+        loop=_LOOP,
+        http=_HTTP,
+    )
 
 
 if __name__ == "__main__":